@@ -10,6 +10,15 @@ print(sys.version)
 # 3.8.0 (default, Oct 21 2019, 12:51:32) 
 # [Clang 6.0 (clang-600.0.57)]
 
+# The version number doesn't say which interpreter is running it.
+# sys.implementation does: 'cpython' for the reference interpreter,
+# 'pypy' for the tracing JIT that speeds up pure-Python loops (like the
+# ones in Items 6 and 9) without code changes. PyPy needs a warm-up of
+# roughly a thousand iterations before a loop is compiled, so time only
+# the steady state when comparing the two.
+print(sys.implementation.name)
+# cpython
+
 # ✦ Python 3 is the most up-to-date and well-supported version of 
 # Python, and you should use it for your projects.
 # ✦ Be sure that the command-line executable for running Python on 
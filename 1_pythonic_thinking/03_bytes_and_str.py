@@ -71,6 +71,13 @@ print('red %s' % b'blue')
 import locale
 print(locale.getpreferredencoding())
 
+# When many files are opened in text mode, look the encoding up once and
+# pass it explicitly. The False argument skips the setlocale call
+DEFAULT_ENCODING = locale.getpreferredencoding(False)
+# for path in paths:
+#     with open(path, 'r', encoding=DEFAULT_ENCODING) as f:
+#         data = f.read()
+
 # ✦ bytes contains sequences of 8-bit values, and str contains sequences of
 # Unicode code points.
 # ✦ Use helper functions to ensure that the inputs you operate on are the type of
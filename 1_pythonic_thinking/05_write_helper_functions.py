@@ -34,6 +34,28 @@ def get_first_int(values, key, default=0):
 
 green = get_first_int(my_values, 'green')
 
+# Since only the first value for each key is ever used, parse_qsl can
+# build a flat dict in a single pass, with no list allocated per key
+# and no [0] indexing in the helper
+from urllib.parse import parse_qsl
+
+first_values = {}
+for key, value in parse_qsl('red=5&blue=0&green=',
+                            keep_blank_values=True):
+    first_values.setdefault(key, value)  # First one wins, like [0]
+print(repr(first_values))
+# {'red': '5', 'blue': '0', 'green': ''}
+
+def get_first_int_flat(values, key, default=0):
+    found = values.get(key)
+    if found:
+        return int(found)
+    return default
+
+assert get_first_int_flat(first_values, 'red') == 5
+assert get_first_int_flat(first_values, 'green') == 0
+assert get_first_int_flat(first_values, 'opacity') == 0
+
 # As soon as expressions get complicated, it’s time to consider splitting
 # them into smaller pieces and moving logic into helper functions. What you
 # gain in readability always outweighs what brevity may have afforded you.
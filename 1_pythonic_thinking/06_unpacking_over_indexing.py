@@ -44,6 +44,28 @@ bubble_sort(names)
 print(names)
 # ['arugula', 'bacon', 'carrots', 'pretzels']
 
+# With unpacking the swap becomes a single line. The inner range is also
+# shortened on every pass, since the largest items have already bubbled
+# to the end, and the loop stops early once a pass makes no swaps.
+def bubble_sort(a):
+    n = len(a)
+    while n > 1:
+        swapped = False
+        for i in range(1, n):
+            if a[i] < a[i-1]:
+                a[i-1], a[i] = a[i], a[i-1]  # Swap
+                swapped = True
+        if not swapped:
+            break
+        n -= 1
+names = ['pretzels', 'carrots', 'arugula', 'bacon']
+bubble_sort(names)
+print(names)
+# ['arugula', 'bacon', 'carrots', 'pretzels']
+
+# bubble_sort is still O(n²) interpreted bytecode; outside of a demo,
+# names.sort() runs Timsort in C and is the one to use.
+
 # right side of the assignment (a[i], a[i-1]) is evaluated first, and
 # its values are put into a new temporary, unnamed tuple
 # (such as ('carrots', 'pretzels') on the first iteration of the loops).
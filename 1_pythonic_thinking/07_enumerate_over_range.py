@@ -6,6 +6,11 @@ for i in range(32):
     if randint(0, 1):
         random_bits |= 1 << i
 print(bin(random_bits))
+# range is the natural fit here since there's no list to index into.
+# Outside of a demo the random module can do it in one C call
+from random import getrandbits
+random_bits = getrandbits(32)
+assert 0 <= random_bits < 1 << 32
 
 # Often, you’ll want to iterate over a list and also know the
 # index of the current item in the list
@@ -17,6 +17,14 @@ for name, count in zip(names, counts):
     if count > max_count:
         longest_name = name
         max_count = count
+print(longest_name)
+# Cecilia
+
+# For a plain "find the largest" scan the built-in max does the same
+# reduction in C. Like the loop above, it keeps the first of equal items
+longest_name = max(names, key=len)
+max_count = len(longest_name)
+assert (longest_name, max_count) == ('Cecilia', 7)
 
 # zip consumes the iterators it wraps one item at a time,
 # which means it can be used with infinitely long inputs
@@ -86,6 +86,15 @@ def coprime_alternate(a, b):
 assert coprime_alternate(4, 9)
 assert not coprime_alternate(3, 6)
 
+# Both helpers try every divisor up to min(a, b). When the search itself
+# isn't the point, math.gcd answers the same question with Euclid's
+# algorithm in O(log min(a, b)) steps, and no loop is needed at all:
+from math import gcd
+def coprime_gcd(a, b):
+    return gcd(a, b) == 1
+assert coprime_gcd(4, 9)
+assert not coprime_gcd(3, 6)
+
 # ✦ Python has special syntax that allows else blocks to immediately
 # follow for and while loop interior blocks.
 # ✦ The else block after a loop runs only if the loop body did not
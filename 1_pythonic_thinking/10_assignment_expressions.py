@@ -65,6 +65,20 @@ elif count := fresh_fruit.get('lemon', 0):
 else:
     to_enjoy = 'Nothing'
 
+# The walrus chain only looks up the keys it reaches. When every count
+# is needed anyway (say, for a report), unpack them once up front and
+# branch on plain local variables instead
+banana, apple, lemon = (fresh_fruit.get(key, 0)
+                        for key in ('banana', 'apple', 'lemon'))
+if banana >= 2:
+    to_enjoy = make_smoothies(slice_bananas(banana))
+elif apple >= 4:
+    to_enjoy = make_cider(apple)
+elif lemon:
+    to_enjoy = make_lemonade(lemon)
+else:
+    to_enjoy = 'Nothing'
+
 # Emulating do/while
 
 def pick_fruit():
@@ -60,6 +60,20 @@ print('After  ', a)
 # you end up with a copy of the original list:
 b = a[:]
 assert b == a and b is not a
+# list.copy does the same without building a slice object, and says
+# what it does
+b = a.copy()
+assert b == a and b is not a
+
+# Slices of bytes, bytearray and array.array copy the data too. Wrapping
+# the buffer in a memoryview gives slices that share the memory instead,
+# so taking one is O(1) no matter how large it is
+import array
+numbers = array.array('i', [1, 2, 3, 4, 5, 6, 7, 8])
+window = memoryview(numbers)[3:]
+window[0] = 99
+print(numbers[3])
+# 99
 
 # If you assign to a slice with no start or end indexes, you replace
 # the entire contents of the list with a copy of what’s referenced
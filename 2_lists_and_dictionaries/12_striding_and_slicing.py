@@ -12,6 +12,19 @@ print(evens)
 # ['red', 'yellow', 'blue']
 # ['orange', 'green', 'purple']
 
+# Both slices are new lists. For numeric data kept in an array.array,
+# a memoryview with a stride is a view onto the same buffer, so no
+# items are copied
+import array
+numbers = array.array('q', range(6))
+view = memoryview(numbers)
+odds_view = view[::2]
+evens_view = view[1::2]
+print(odds_view.tolist(), evens_view.tolist())
+# [0, 2, 4] [1, 3, 5]
+numbers[0] = 100
+assert odds_view[0] == 100
+
 # The problem is that the stride syntax often causes unexpected behavior
 # that can introduce bugs. For example, a common Python trick for reversing
 # a byte string is to slice the string with a stride of -1:
@@ -19,6 +32,12 @@ x = b'mongoose'
 y = x[::-1]
 print(y)
 # b'esoognom'
+# The slice is copied in C, so it's already fast; what it costs is a
+# second buffer the size of the first. A bytearray can be reversed in
+# place instead:
+buf = bytearray(b'mongoose')
+buf.reverse()
+assert buf == y
 
 x = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
 x[::2]   # ['a', 'c', 'e', 'g']
@@ -18,6 +18,13 @@ print(oldest, second_oldest, others)
 oldest, second_oldest, *others = car_ages_descending
 print(oldest, second_oldest, others)
 
+# If only the top few are needed and the rest can stay unsorted,
+# heapq.nlargest finds them in O(n log k) without sorting everything
+import heapq
+oldest, second_oldest = heapq.nlargest(2, car_ages)
+print(oldest, second_oldest)
+# 20 19
+
 # A starred expression may appear in any position, so you can get
 # the benefits of catch-all unpacking anytime you need to extract one slice
 oldest, *others, youngest = car_ages_descending
@@ -82,6 +89,14 @@ print('Row count: ', len(rows))
 # to crash. So you should only use catch-all unpacking on iterators
 # when you have good reason to believe that the result data will all fit in memory.
 
+# When the rows only need to be looped over once, take the header with
+# next and keep the rest as the iterator, so nothing is materialized
+it = generate_csv()
+header = next(it)
+row_count = sum(1 for _ in it)
+print('CSV Header:', header)
+print('Row count: ', row_count)
+
 # ✦ Unpacking assignments may use a starred expression to catch all values
 # that weren’t assigned to the other parts of the unpacking pattern into a list.
 # ✦ Starred expressions may appear in any position, and they will always
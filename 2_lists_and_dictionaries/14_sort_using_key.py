@@ -43,6 +43,10 @@ places.sort()
 print('Case sensitive:  ', places)
 places.sort(key=lambda x: x.lower())
 print('Case insensitive:', places)
+# The lambda only forwards to a method, so the method itself can be the
+# key. This skips one Python-level call per item
+places.sort(key=str.lower)
+print('Case insensitive:', places)
 
 # Sometimes you may need to use multiple criteria for sorting.
 power_tools = [
@@ -69,6 +73,11 @@ assert drill < sander         # Thus, drill comes first
 # to sort the list of power tools first by weight and then by name.
 power_tools.sort(key=lambda x: (x.weight, x.name))
 print(power_tools)
+# operator.attrgetter builds the same tuple in C, without calling
+# a Python-level lambda for every item
+from operator import attrgetter
+power_tools.sort(key=attrgetter('weight', 'name'))
+print(power_tools)
 
 # One limitation of having the key function return a tuple is that
 # the direction of sorting for all criteria must be the same
@@ -91,6 +100,19 @@ power_tools.sort(key=lambda x: x.name)   # Name ascending
 power_tools.sort(key=lambda x: x.weight, # Weight descending
                  reverse=True)
 
+# The same order can come out of a single sort by wrapping a comparison
+# function with functools.cmp_to_key. Each criterion picks its own
+# direction, so nothing needs to be negatable. The catch is that the
+# function runs once per comparison instead of once per item, so for
+# large lists the two stable passes above usually win
+from functools import cmp_to_key
+def compare_tools(a, b):
+    if a.weight != b.weight:
+        return (b.weight > a.weight) - (b.weight < a.weight)  # Descending
+    return (a.name > b.name) - (a.name < b.name)              # Ascending
+by_comparison = sorted(power_tools, key=cmp_to_key(compare_tools))
+assert by_comparison == power_tools
+
 # This same approach can be used to combine as many different types of
 # sorting criteria as you’d like in any direction, respectively. You just
 # need to make sure that you execute the sorts in the opposite sequence of
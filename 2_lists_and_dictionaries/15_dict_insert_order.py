@@ -49,24 +49,37 @@ for key, value in a.__dict__.items():
 # However, you shouldn’t always assume that insertion ordering behavior
 # will be present when you’re handling dictionaries (because custom class
 # may not conform to this contract):
+from bisect import bisect_left, insort
 from collections.abc import MutableMapping
 class SortedDict(MutableMapping):
     def __init__(self):
         self.data = {}
+        self.keys_sorted = []  # Kept in order, so iterating never sorts
     def __getitem__(self, key):
         return self.data[key]
     def __setitem__(self, key, value):
+        if key not in self.data:
+            insort(self.keys_sorted, key)
         self.data[key] = value
     def __delitem__(self, key):
         del self.data[key]
+        del self.keys_sorted[bisect_left(self.keys_sorted, key)]
     def __iter__(self):
-        keys = list(self.data.keys())
-        keys.sort()
-        for key in keys:
-            yield key
+        return iter(self.keys_sorted.copy())  # Safe to delete while iterating
     def __len__(self):
         return len(self.data)
 
+sorted_names = SortedDict()
+sorted_names['dog'] = 'puppy'
+sorted_names['cat'] = 'kitten'
+sorted_names['goose'] = 'gosling'
+del sorted_names['dog']
+print(list(sorted_names))
+# ['cat', 'goose']
+for key in sorted_names:
+    del sorted_names[key]
+assert len(sorted_names) == 0
+
 # The problem of non-matching contracts/expectations can be mitigated:
 # - no longer assume that dict-like object has a specific iteration order
 # - add an explicit check to ensure that the type of object matches expectations
@@ -53,6 +53,13 @@ except KeyError:
 # If you’re maintaining dictionaries of counters like this, it’s worth
 # considering the Counter class from the collections built-in module,
 # which provides most of the facilities you are likely to need.
+# Counter.update takes a whole batch of keys and does the lookup and
+# increment for each one in C:
+from collections import Counter
+bread_counts = Counter(counters)
+bread_counts.update(['wheat', 'sourdough', 'wheat'])
+print(bread_counts.most_common(1), bread_counts['sourdough'])
+# [('wheat', 8)] 2
 
 # What if the values of the dictionary are a more complex type, like a list?
 votes = {
@@ -63,6 +63,34 @@ image_data = handle.read()
 # accesses of the same path will not call __missing__ since the
 # corresponding item is already present.
 
+# Pictures never closes a handle, so a long-running program will
+# eventually run out of file descriptors. Building on OrderedDict
+# (see Item 15) bounds it as an LRU cache: hits move the key to the end,
+# and a miss past maxsize closes the least recently used handle. An evicted
+# handle is closed even if a caller is still holding on to it.
+from collections import OrderedDict
+class LRUPictures(OrderedDict):
+    def __init__(self, *args, maxsize=128, **kwargs):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        super().__init__(*args, **kwargs)
+        self.maxsize = maxsize
+    def __getitem__(self, key):
+        value = super().__getitem__(key)  # Calls __missing__ if needed
+        self.move_to_end(key)
+        return value
+    def __missing__(self, key):
+        value = open_picture(key)
+        self[key] = value
+        if len(self) > self.maxsize:
+            _, oldest = self.popitem(last=False)
+            oldest.close()
+        return value
+pictures = LRUPictures(maxsize=256)
+handle = pictures[path]
+handle.seek(0)
+image_data = handle.read()
+
 # ✦ The setdefault method of dict is a bad fit when creating the default
 # value has high computational cost or may raise exceptions.
 # ✦ The function passed to defaultdict must not require any arguments,
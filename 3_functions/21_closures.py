@@ -110,6 +110,7 @@ def sort_priority3(numbers, group):
 # When your usage of nonlocal starts getting complicated, it’s better to wrap
 # your state in a helper class.
 class Sorter:
+    __slots__ = ('group', 'found')  # Fixed attributes, no instance __dict__
     def __init__(self, group):
         self.group = group
         self.found = False
@@ -123,6 +124,17 @@ sorter = Sorter(group)
 numbers.sort(key=sorter)
 assert sorter.found is True
 
+# The state is only there to answer "was anything from group seen?".
+# That question doesn't need to be answered inside the key function at
+# all: a set operation can check it in one step, leaving a stateless
+# key with nothing to write back
+def sort_priority4(numbers, group):
+    numbers.sort(key=lambda x: (0, x) if x in group else (1, x))
+    return not set(group).isdisjoint(numbers) # group may be any container
+assert sort_priority4(numbers, group) is True
+assert sort_priority4([1, 4, 6], group) is False
+assert sort_priority4([1, 4, 6], [2, 3, 5, 7]) is False
+
 # ✦ Closure functions can refer to variables from any of the scopes in which they
 # were defined.
 # ✦ By default, closures can’t affect enclosing scopes by assigning variables.
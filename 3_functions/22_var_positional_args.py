@@ -9,7 +9,7 @@ def log(message, values):
     if not values:
         print(message)
     else:
-        values_str = ', '.join(str(x) for x in values)
+        values_str = ', '.join(map(str, values))
         print(f'{message}: {values_str}')
 log('My numbers are', [1, 2])
 log('Hi there', [])
@@ -22,7 +22,7 @@ def log(message, *values):  # The only difference
     if not values:
         print(message)
     else:
-        values_str = ', '.join(str(x) for x in values)
+        values_str = ', '.join(map(str, values))
         print(f'{message}: {values_str}')
 log('My numbers are', 1, 2)
 log('Hi there')  # Much better
@@ -46,6 +46,21 @@ it = my_generator()
 my_func(*it)
 # (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)
 
+# If callers may hand over a long generator, take it as a single argument
+# and write each value as it arrives. Note that join isn't enough here:
+# it collects its input into a list before joining.
+def log_iter(message, values):
+    print(message, end='')
+    separator = ': '
+    for value in values:
+        print(separator, value, sep='', end='')
+        separator = ', '
+    print()
+log_iter('Streamed numbers', my_generator())
+log_iter('Hi there', [])
+# Streamed numbers: 0, 1, 2, 3, 4, 5, 6, 7, 8, 9
+# Hi there
+
 # The second issue with *args is that you can’t add new positional arguments to a
 # function in the future without migrating every caller. If you try to add a
 # positional argument in the front of the argument list, existing callers will
@@ -54,7 +69,7 @@ def log(sequence, message, *values):
     if not values:
         print(f'{sequence} - {message}')
     else:
-        values_str = ', '.join(str(x) for x in values)
+        values_str = ', '.join(map(str, values))
         print(f'{sequence} - {message}: {values_str}')
 log(1, 'Favorites', 7, 33)      # New with *args OK
 log(1, 'Hi there')              # New message only OK
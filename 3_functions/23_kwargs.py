@@ -27,6 +27,11 @@ my_kwargs = {
     'divisor': 7,
 }
 assert remainder(**my_kwargs) == 6
+# The ** call matches each dictionary key to a parameter name at call
+# time. If the same call runs in a tight loop, pull the values out once
+# and pass them positionally instead
+number, divisor = my_kwargs['number'], my_kwargs['divisor']
+assert remainder(number, divisor) == 6
 
 # You can mix the ** operator with positional arguments or keyword
 # arguments in the function call, as long as no argument is repeated:
@@ -52,6 +57,17 @@ def print_parameters(**kwargs):
     for key, value in kwargs.items():
         print(f'{key} = {value}')
 print_parameters(alpha=1.5, beta=9, gamma=4)
+# alpha = 1.5
+# beta = 9
+# gamma = 4
+
+# With many parameters, building the text first and writing it with one
+# print call avoids a separate write to stdout for each line. The guard
+# keeps an empty call from printing a blank line, which the loop never does
+def print_parameters(**kwargs):
+    if kwargs:
+        print('\n'.join(f'{key} = {value}' for key, value in kwargs.items()))
+print_parameters(alpha=1.5, beta=9, gamma=4)
 
 # The first benefit is that keyword arguments make the function call clearer
 # to new readers of the code.
@@ -89,6 +89,27 @@ assert foo is not bar
 # Foo: {'stuff': 5}
 # Bar: {'meep': 1}
 
+# If None is itself a value callers may want back, a private sentinel
+# object can mark "not supplied" instead, since no caller can pass it
+_MISSING = object()
+def decode(data, default=_MISSING):
+    """Load JSON data from a string.
+
+    Args:
+        data: JSON data to decode.
+        default: Value to return if decoding fails.
+            Defaults to a new empty dictionary.
+    """
+    try:
+        return json.loads(data)
+    except ValueError:
+        if default is _MISSING:
+            return {}
+        return default
+
+assert decode('bad data', default=None) is None
+assert decode('bad data') is not decode('also bad')
+
 # This approach also works with type annotations
 from typing import Optional
 def log_typed(message: str,
@@ -104,6 +125,24 @@ def log_typed(message: str,
         when = datetime.now()
     print(f'{when}: {message}')
 
+# Evaluating a default once is exactly what you want when the value is
+# fixed. Binding the datetime.now function itself (not its result) makes
+# it a local variable in the body, saving a global and an attribute lookup
+# on every call. The keyword-only, underscore-prefixed name (see Item 25)
+# keeps callers from passing it by accident
+def log(message, when=None, *, _now=datetime.now):
+    """Log a message with a timestamp.
+
+    Args:
+        message: Message to print.
+        when: datetime of when the message occurred.
+            Defaults to the present time.
+    """
+    if when is None:
+        when = _now()
+    print(f'{when}: {message}')
+log('Hi there!')
+
 # ✦ A default argument value is evaluated only once: during function definition
 # at module load time. This can cause odd behaviors for dynamic values
 # (like {}, [], or datetime.now()).
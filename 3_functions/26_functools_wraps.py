@@ -89,6 +89,31 @@ print(pickle.dumps(fibonacci))
 # __annotations__) that must be preserved to maintain the interface of functions
 # in the language. Using wraps ensures that you’ll always get the correct behavior.
 
+# Decorators stack. The recursive fibonacci above takes exponential time
+# because it recomputes the same values over and over; lru_cache from the
+# same module memoizes it, so each n is computed only once. Since both
+# decorators use wraps, the result still looks like fibonacci, and the
+# cache is reachable through __wrapped__:
+from functools import lru_cache
+@trace
+@lru_cache(maxsize=None)
+def fibonacci(n):
+    """Return the n-th Fibonacci number"""
+    if n in (0, 1):
+        return n
+    return (fibonacci(n - 2) + fibonacci(n - 1))
+
+fibonacci(4)
+print(fibonacci.__name__, fibonacci.__wrapped__.cache_info())
+# fibonacci((0,), {}) -> 0
+# fibonacci((1,), {}) -> 1
+# fibonacci((2,), {}) -> 1
+# fibonacci((1,), {}) -> 1
+# fibonacci((2,), {}) -> 1
+# fibonacci((3,), {}) -> 2
+# fibonacci((4,), {}) -> 3
+# fibonacci CacheInfo(hits=2, misses=5, maxsize=None, currsize=5)
+
 # ✦ Decorators in Python are syntax to allow one function to modify another
 # function at runtime.
 # ✦ Using decorators can cause strange behaviors in tools that do introspection,
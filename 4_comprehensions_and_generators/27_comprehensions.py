@@ -2,29 +2,32 @@
 
 # list comprehensions
 a = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+# x * x gives the same result as x**2 for numbers, but the interpreter
+# doesn't rewrite one into the other, and plain multiplication is the
+# cheaper operation
 squares = []
 for x in a:
-    squares.append(x**2)
+    squares.append(x * x)
 
-assert squares == [x**2 for x in a]  # List comprehension
+assert squares == [x * x for x in a]  # List comprehension
 
 # Unless you’re applying a single-argument function, list comprehensions are also clearer than the map
 # built-in function for simple cases. map requires the creation of a lambda function for the computation,
 # which is visually noisy:
-alt = map(lambda x: x ** 2, a)
+alt = map(lambda x: x * x, a)
 
 # list comprehensions let you easily filter items from the input list, removing corresponding outputs from
 # the result
-even_squares = [x**2 for x in a if x % 2 == 0]
+even_squares = [x * x for x in a if x % 2 == 0]
 
-alt = map(lambda x: x**2, filter(lambda x: x % 2 == 0, a))
+alt = map(lambda x: x * x, filter(lambda x: x % 2 == 0, a))
 assert even_squares == list(alt)
 
 # Dictionaries and sets have their own equivalents of list comprehensions
-even_squares_dict = {x: x**2 for x in a if x % 2 == 0}
+even_squares_dict = {x: x * x for x in a if x % 2 == 0}
 threes_cubed_set = {x**3 for x in a if x % 3 == 0}
 
-alt_dict = dict(map(lambda x: (x, x**2),
+alt_dict = dict(map(lambda x: (x, x * x),
                 filter(lambda x: x % 2 == 0, a)))
 alt_set = set(map(lambda x: x**3,
               filter(lambda x: x % 3 == 0, a)))
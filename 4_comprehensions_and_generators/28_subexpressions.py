@@ -6,7 +6,11 @@ flat = [x for row in matrix for x in row]
 print(flat)
 # [1, 2, 3, 4, 5, 6, 7, 8, 9]
 
-squared = [[x**2 for x in row] for row in matrix]
+# Flattening one level is common enough that itertools does it in C
+from itertools import chain
+assert list(chain.from_iterable(matrix)) == flat
+
+squared = [[x * x for x in row] for row in matrix]
 print(squared)
 # [[1, 4, 9], [16, 25, 36], [49, 64, 81]]
 
@@ -23,6 +27,8 @@ print(squared)
 # for sublist1 in my_lists:
 #     for sublist2 in sublist1:
 #         flat.extend(sublist2)
+# or, with no Python-level loop at all
+# flat = list(chain.from_iterable(chain.from_iterable(my_lists)))
 
 # Comprehensions support multiple if conditions. Multiple conditions at the same loop level have an
 # implicit and expression. For example, say that I want to filter a list of numbers to only even values
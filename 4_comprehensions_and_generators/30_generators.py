@@ -24,6 +24,17 @@ def index_words_iter(text):
         if letter == ' ':
             yield index + 1
 
+# The generator still runs Python code for every character. str.find
+# skips ahead to the next space in C, so the loop body only runs once
+# per word
+def index_words_find(text):
+    if text:
+        yield 0
+    index = text.find(' ')
+    while index != -1:
+        yield index + 1
+        index = text.find(' ', index + 1)
+
 
 # When called, a generator function does not actually run but instead immediately
 # returns an iterator. With each call to the next built-in function, the iterator
@@ -40,6 +51,7 @@ print(next(it))
 result = list(index_words_iter(address))
 print(result[:10])
 # [0, 5, 11, 15, 21, 27, 31, 35, 43, 51]
+assert list(index_words_find(address)) == result
 
 # The second problem with index_words is that it requires all results to be stored in
 # the list before being returned. For huge inputs, this can cause a program to run out
@@ -59,6 +71,24 @@ def index_file(handle):
                 yield offset
 
 # The working memory for this function is limited to the maximum length of one line of input.
+
+# As with index_words_find, str.find can do the per-character scan, and the
+# offset only needs to advance once per line
+def index_file_find(handle):
+    offset = 0
+    for line in handle:
+        if line:
+            yield offset
+        index = line.find(' ')
+        while index != -1:
+            yield offset + index + 1
+            index = line.find(' ', index + 1)
+        offset += len(line)
+
+import io
+text = 'Four score and seven\nyears ago our fathers\n'
+assert (list(index_file_find(io.StringIO(text))) ==
+        list(index_file(io.StringIO(text))))
 # with open('address.txt', 'r') as f:
 #     it = index_file(f)
 #     results = itertools.islice(it, 0, 10)
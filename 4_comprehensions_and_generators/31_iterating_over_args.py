@@ -14,6 +14,13 @@ print(percentages)
 assert sum(percentages) == 100.0
 # [11.538461538461538, 26.923076923076923, 61.53846153846154]
 
+# The append loop can be a list comprehension (see Item 27), which builds
+# the list without looking up and calling result.append for every value
+def normalize(numbers):
+    total = sum(numbers)
+    return [100 * value / total for value in numbers]
+assert normalize(visits) == percentages
+
 def read_visits(data_path):
     with open(data_path) as f:
         for line in f:
@@ -57,6 +64,15 @@ def normalize_copy(numbers):
 # [11.538461538461538, 26.923076923076923, 61.53846153846154]
 
 # The problem with this approach is that the copy of the input iterator’s contents could be extremely large.
+# For numbers, the copy can at least be compact: an array.array stores raw
+# 8-byte floats rather than a list of pointers to separate float objects
+import array
+def normalize_copy(numbers):
+    numbers_copy = array.array('d', numbers)  # Copy as raw doubles
+    total = sum(numbers_copy)
+    return [100 * value / total for value in numbers_copy]
+assert normalize_copy(iter(visits)) == percentages
+
 # One way around this is to accept a function that returns a new iterator each time it’s called
 def normalize_func(get_iter):
     total = sum(get_iter())   # New iterator
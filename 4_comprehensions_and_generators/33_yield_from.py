@@ -57,6 +57,14 @@ run(animate_composed)
 # Delta: 3.0
 # Delta: 3.0
 
+# When every segment just repeats a constant, itertools can build the same
+# stream out of C-level iterators, with no generator frames to resume
+from itertools import chain, repeat
+def animate_repeat():
+    return chain(repeat(5.0, 4), repeat(0, 3), repeat(3.0, 2))
+
+assert list(animate_repeat()) == list(animate_composed())
+
 # yield from essentially causes the Python interpreter to handle the nested for loop
 # and yield expression boilerplate for you, which results in better performance.
 import timeit
@@ -162,6 +162,31 @@ run_modulating(complex_wave_modulating())
 # makes it even worse. My advice is to avoid the send method entirely
 # and go with a simpler approach.
 
+# If send has to stay, the None values can be avoided by not nesting
+# generators at all: a single generator loops over the segments itself,
+# so there is only one bare yield, at the very start
+def complex_wave_modulating():
+    amplitude = yield # Receive initial amplitude
+    for steps in (3, 4, 5):
+        step_size = 2 * math.pi / steps
+        for step in range(steps):
+            output = amplitude * math.sin(step * step_size)
+            amplitude = yield output # Receive next amplitude
+run_modulating(complex_wave_modulating())
+# Output is None
+# Output: 0.0
+# Output: 6.1
+# Output: -6.1
+# Output: 0.0
+# Output: 2.0
+# Output: 0.0
+# Output: -2.0
+# Output: 0.0
+# Output: 9.5
+# Output: 5.9
+# Output: -5.9
+# Output: -9.5
+
 # The easiest solution is to pass an iterator into the wave function.
 def wave_cascading(amplitude_it, steps):
     step_size = 2 * math.pi / steps
@@ -197,6 +222,29 @@ run_cascading()
 # Output: -5.9
 # Output: -9.5
 
+# The sine values don't depend on the amplitudes, so they can be computed
+# up front in a comprehension. The amplitudes are still pulled with next so
+# that an input that runs short raises an error (RuntimeError, per PEP 479)
+# instead of quietly cutting the segment short, as zip or map would
+def wave_cascading(amplitude_it, steps):
+    step_size = 2 * math.pi / steps
+    fractions = [math.sin(step * step_size) for step in range(steps)]
+    for fraction in fractions:
+        yield next(amplitude_it) * fraction
+run_cascading()
+# Output: 0.0
+# Output: 6.1
+# Output: -6.1
+# Output: 0.0
+# Output: 2.0
+# Output: 0.0
+# Output: -2.0
+# Output: 0.0
+# Output: 9.5
+# Output: 5.9
+# Output: -5.9
+# Output: -9.5
+
 # The best part about this approach is that the iterator can come from
 # anywhere and could be completely dynamic (e.g., implemented using
 # a generator function). The only downside is that this code assumes
@@ -24,6 +24,11 @@ it = itertools.cycle([1, 2])
 result = [next(it) for _ in range (10)]
 print(result)
 # [1, 2, 1, 2, 1, 2, 1, 2, 1, 2]
+# islice (see below) can take the first ten items without a Python loop
+# calling next:
+it = itertools.cycle([1, 2])
+result = list(itertools.islice(it, 10))
+assert result == [1, 2, 1, 2, 1, 2, 1, 2, 1, 2]
 
 # tee
 # Use tee to split a single iterator into the number of parallel iterators
@@ -37,6 +42,14 @@ print(list(it3))
 # ['first', 'second']
 # ['first', 'second']
 # ['first', 'second']
+# tee only pays off for a one-shot source whose consumers advance at
+# similar speeds. If each consumer drains everything anyway, the buffer ends
+# up holding every item; materializing a list once and taking independent
+# iterators over it uses the same memory with no per-item bookkeeping:
+source = iter(['first', 'second']) # One-shot
+data = list(source)
+it1, it2, it3 = iter(data), iter(data), iter(data)
+assert list(it1) == list(it2) == list(it3) == ['first', 'second']
 
 # zip_longest
 # This variant of the zip built-in function returns a placeholder value when an
@@ -74,6 +87,11 @@ less_than_seven = lambda x: x < 7
 it = itertools.takewhile(less_than_seven, values)
 print(list(it))
 # [1, 2, 3, 4, 5, 6]
+# The lambda runs as Python code for every item. When the input is a sorted
+# list, as it is here, bisect can find the cut point in O(log n) and a slice
+# copies the prefix, with no predicate calls at all:
+from bisect import bisect_left
+assert values[:bisect_left(values, 7)] == [1, 2, 3, 4, 5, 6]
 
 # dropwhile
 # dropwhile, which is the opposite of takewhile, skips items from an
@@ -115,6 +133,12 @@ print('Modulo:', list(modulo_reduce))
 # This is essentially the same as the reduce function from the functools
 # built-in module, but with outputs yielded one step at a time. By default
 # it sums the inputs if no binary function is specified.
+# sum_modulo_20 is a Python call for every item. For integers, taking the
+# modulo of each running total gives the same results, so the default C
+# addition plus operator.mod can do the whole scan without any Python frames:
+from operator import mod
+modulo_reduce = map(mod, itertools.accumulate(values), itertools.repeat(20))
+assert list(modulo_reduce) == [1, 3, 6, 10, 15, 1, 8, 16, 5, 15]
 
 # product
 # product returns the Cartesian product of items from one or more iterators,
@@ -125,6 +149,10 @@ multiple = itertools.product([1, 2], ['a', 'b'])
 print('Multiple:', list(multiple))
 # Single: [(1, 1), (1, 2), (2, 1), (2, 2)]
 # Multiple: [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')]
+# Each combination is a new tuple, so wrapping a large product in list
+# (e.g., all 16.7 million 8-bit RGB colors from product(range(256), repeat=3))
+# keeps millions of tuples alive at once. Loop over the product directly
+# instead, so each tuple can be freed once it has been used.
 
 # permutations
 # permutations returns the unique ordered permutations of length N
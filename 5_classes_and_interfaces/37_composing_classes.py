@@ -56,6 +56,66 @@ book.report_grade('Albert Einstein', 'Gym', 85, 0.60)
 print(book.average_grade('Albert Einstein'))
 # 80.25
 
+# The inner loop unpacks a tuple and does the arithmetic in Python for every
+# grade. Keeping scores and weights in two parallel arrays of raw doubles
+# instead lets map and sum do the weighted reduction in C
+import array
+from operator import mul
+class WeightedGradebook:
+    def __init__(self):
+        self._grades = {}
+    def add_student(self, name):
+        self._grades[name] = defaultdict(
+            lambda: (array.array('d'), array.array('d')))
+    def report_grade(self, name, subject, score, weight):
+        scores, weights = self._grades[name][subject]
+        scores.append(score)
+        weights.append(weight)
+    def report_grades(self, name, subject, scores, weights):
+        scores = array.array('d', scores)
+        weights = array.array('d', weights)
+        if len(scores) != len(weights):
+            raise ValueError('scores and weights must have the same length')
+        if not scores:
+            return # Don't create a subject with no grades to average
+        subject_scores, subject_weights = self._grades[name][subject]
+        subject_scores.extend(scores)
+        subject_weights.extend(weights)
+    def average_grade(self, name):
+        by_subject = self._grades[name]
+        score_sum = 0
+        for scores, weights in by_subject.values():
+            score_sum += sum(map(mul, scores, weights)) / sum(weights)
+        return score_sum / len(by_subject)
+book = WeightedGradebook()
+book.add_student('Albert Einstein')
+book.report_grade('Albert Einstein', 'Math', 75, 0.05)
+book.report_grade('Albert Einstein', 'Math', 65, 0.15)
+book.report_grade('Albert Einstein', 'Math', 70, 0.80)
+book.report_grade('Albert Einstein', 'Gym', 100, 0.40)
+book.report_grade('Albert Einstein', 'Gym', 85, 0.60)
+print(book.average_grade('Albert Einstein'))
+# 80.25
+
+# When grades arrive in batches, report_grades looks up the subject once and
+# extends both arrays in C rather than appending one grade at a time
+book = WeightedGradebook()
+book.add_student('Albert Einstein')
+book.report_grades('Albert Einstein', 'Math', [75, 65, 70], [0.05, 0.15, 0.80])
+book.report_grades('Albert Einstein', 'Gym', [100, 85], [0.40, 0.60])
+print(book.average_grade('Albert Einstein'))
+# 80.25
+# Batches whose lengths differ are rejected before either array is touched,
+# so the scores and weights can never get out of step:
+# book.report_grades('Albert Einstein', 'Math', [75, 65], [0.05, 0.15, 0.80])
+# Traceback ...
+# ValueError: scores and weights must have the same length
+# An empty batch is ignored rather than adding a subject with no grades,
+# which average_grade would otherwise divide by zero on:
+book.report_grades('Albert Einstein', 'Art', [], [])
+print(book.average_grade('Albert Einstein'))
+# 80.25
+
 # Refactoring to Classes
 
 from collections import namedtuple
@@ -75,6 +135,13 @@ Grade = namedtuple('Grade', ('score', 'weight'))
 # of all of the usage of your namedtuple instances, it’s better to
 # explicitly define a new class.
 
+# Memory is rarely a reason to switch. A @dataclass(slots=True, frozen=True)
+# Grade is 48 bytes against namedtuple’s 56 (sys.getsizeof on CPython 3.11),
+# but frozen dataclasses are slower to construct because __init__ has to
+# assign through object.__setattr__. If millions of grades have to fit in
+# memory, the two array.array('d') buffers used by WeightedGradebook above
+# cost 16 bytes per grade and no objects at all.
+
 class Subject:
     def __init__(self):
         self._grades = []
@@ -101,6 +168,9 @@ class Student:
 
 class Gradebook:
     def __init__(self):
+        # A hit is a plain dict lookup and a miss calls Student() from C;
+        # setdefault(name, Student()) would build a throwaway Student on
+        # every call, even for names that are already present
         self._students = defaultdict(Student)
     def get_student(self, name):
         return self._students[name]
@@ -117,6 +187,59 @@ gym.report_grade(85, 0.60)
 print(albert.average_grade())
 # 80.25
 
+# Subject.average_grade rescans every grade on each call. If averages are
+# queried often, the two sums can be kept up to date as grades are reported
+# instead, which turns each query into a single divide. The catch is that
+# the individual grades are no longer kept around
+class Subject:
+    def __init__(self):
+        self._weighted_sum = 0
+        self._total_weight = 0
+    def report_grade(self, score, weight):
+        self._weighted_sum += score * weight
+        self._total_weight += weight
+    def average_grade(self):
+        return self._weighted_sum / self._total_weight
+
+book = Gradebook()
+albert = book.get_student('Albert Einstein')
+math = albert.get_subject('Math')
+math.report_grade(75, 0.05)
+math.report_grade(65, 0.15)
+math.report_grade(70, 0.80)
+gym = albert.get_subject('Gym')
+gym.report_grade(100, 0.40)
+gym.report_grade(85, 0.60)
+print(albert.average_grade())
+# 80.25
+
+# Adding floats one at a time, in a loop or in a running sum, lets rounding
+# error build up over very long lists of grades. When the grades are kept,
+# math.fsum tracks the lost low-order bits and returns the correctly rounded
+# total instead
+from math import fsum
+class Subject:
+    def __init__(self):
+        self._grades = []
+    def report_grade(self, score, weight):
+        self._grades.append(Grade(score, weight))
+    def average_grade(self):
+        total = fsum(grade.score * grade.weight for grade in self._grades)
+        total_weight = fsum(grade.weight for grade in self._grades)
+        return total / total_weight
+
+book = Gradebook()
+albert = book.get_student('Albert Einstein')
+math = albert.get_subject('Math')
+math.report_grade(75, 0.05)
+math.report_grade(65, 0.15)
+math.report_grade(70, 0.80)
+gym = albert.get_subject('Gym')
+gym.report_grade(100, 0.40)
+gym.report_grade(85, 0.60)
+print(albert.average_grade())
+# 80.25
+
 # ✦ Avoid making dictionaries with values that are dictionaries, long
 # tuples, or complex nestings of other built-in types.
 # ✦ Use namedtuple for lightweight, immutable data containers before
@@ -5,6 +5,15 @@ names.sort(key=len)
 print(names)
 # ['Plato', 'Socrates', 'Aristotle', 'Archimedes']
 
+# len is implemented in C, so the sort never enters Python code to compute
+# a key. The operator module builds C callables for the other common cases,
+# which avoids running a lambda frame for every element:
+from operator import itemgetter
+pairs = [('Plato', 428), ('Socrates', 470), ('Aristotle', 384)]
+pairs.sort(key=itemgetter(1)) # Instead of key=lambda x: x[1]
+print(pairs)
+# [('Aristotle', 384), ('Plato', 428), ('Socrates', 470)]
+
 # In Python, many hooks are just stateless functions
 # with well-defined arguments and return values. Functions are ideal
 # for hooks because they are easier to describe and simpler to define
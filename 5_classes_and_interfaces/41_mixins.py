@@ -16,10 +16,8 @@ class ToDictMixin:
     def to_dict(self):
         return self._traverse_dict(self.__dict__)
     def _traverse_dict(self, instance_dict):
-        output = {}
-        for key, value in instance_dict.items():
-            output[key] = self._traverse(key, value)
-        return output
+        return {key: self._traverse(key, value)
+                for key, value in instance_dict.items()}
     def _traverse(self, key, value):
         if isinstance(value, ToDictMixin):
             return value.to_dict()
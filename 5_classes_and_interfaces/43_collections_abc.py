@@ -23,6 +23,17 @@ print('Frequency:', foo.frequency())
 # After pop: ['a', 'b', 'a', 'c', 'b', 'a']
 # Frequency: {'a': 3, 'b': 2, 'c': 1}
 
+# collections.Counter counts the items of an iterable with a loop written in
+# C. It is a dict subclass, so callers of frequency see the same mapping:
+from collections import Counter
+class FrequencyList(list):
+    def __init__(self, members):
+        super().__init__(members)
+    def frequency(self):
+        return Counter(self)
+foo = FrequencyList(['a', 'b', 'a', 'c', 'b', 'a'])
+assert foo.frequency() == {'a': 3, 'b': 2, 'c': 1}
+
 # Now, imagine that I want to provide an object that feels like a list
 # and allows indexing but isn’t a list subclass.
 class BinaryNode:
@@ -70,6 +81,34 @@ print('Tree is', list(tree))
 # 17 in the tree? False
 # Tree is [2, 5, 6, 7, 10, 11, 15]
 
+# Every value _traverse yields is passed up through one yield from per level
+# of the tree, so deep nodes cost several generator resumptions each. Keeping
+# the path back to the root in an explicit stack yields each node directly:
+class StackIndexableNode(IndexableNode):
+    def _traverse(self):
+        stack = []
+        node = self
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node
+                node = node.right
+stack_tree = StackIndexableNode(
+    10,
+    left=StackIndexableNode(
+        5,
+        left=StackIndexableNode(2),
+        right=StackIndexableNode(
+            6,
+            right=StackIndexableNode(7))),
+    right=StackIndexableNode(
+        15,
+        left=StackIndexableNode(11)))
+assert list(stack_tree) == [2, 5, 6, 7, 10, 11, 15]
+
 # The problem is that implementing __getitem__ isn’t enough to provide
 # all of the sequence semantics you’d expect from a list instance:
 # len(tree)
@@ -100,6 +139,45 @@ tree = SequenceNode(
 print('Tree length is', len(tree))
 # Tree length is 7
 
+# Both len and every index lookup walk the tree again from the root, so
+# looping over indexes is O(n²). If the tree isn't changed once it has been
+# built, the values can be collected once on first use and reused by both.
+# Defining __iter__ as well means for loops, list and the in operator read
+# the values directly instead of probing __getitem__ until IndexError:
+from functools import cached_property
+class SequenceNode(IndexableNode):
+    @cached_property
+    def _values(self):
+        return tuple(node.value for node in self._traverse())
+    def __getitem__(self, index):
+        return self._values[index]
+    def __len__(self):
+        return len(self._values)
+    def __iter__(self):
+        return iter(self._values)
+tree = SequenceNode(
+    10,
+    left=SequenceNode(
+        5,
+        left=SequenceNode(2),
+        right=SequenceNode(
+            6,
+            right=SequenceNode(7))),
+    right=SequenceNode(
+        15,
+        left=SequenceNode(11))
+)
+assert len(tree) == 7
+assert list(tree) == [2, 5, 6, 7, 10, 11, 15]
+# Because indexing now goes straight to a tuple, it also behaves like one:
+# negative indexes count from the end and slices return tuples
+assert tree[-1] == 15
+assert tree[1:3] == (5, 6)
+# tree[7]
+# >>>
+# Traceback ...
+# IndexError: tuple index out of range
+
 # Also missing are the count and index methods that a
 # Python programmer would expect to see on a sequence like list or
 # tuple.